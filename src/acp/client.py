@@ -13,6 +13,25 @@ log = logging.getLogger(__name__)
 
 _BUF_SIZE = 4 * 1024 * 1024
 
+_CLIENT_CAPABILITIES = {
+    "fs": {"readTextFile": True, "writeTextFile": True},
+    "terminal": True,
+}
+_CLIENT_INFO = {"name": "kiro2chat", "version": "1.0.0"}
+
+# Base64 prefix -> mime type, checked in order
+_B64_IMAGE_SIGNATURES = (
+    ("iVBORw", "image/png"),
+    ("/9j/", "image/jpeg"),
+    ("R0lGOD", "image/gif"),
+    ("UklGR", "image/webp"),
+)
+
+# Fixed message fragments (never mutated, only serialized)
+_OUTCOME_CANCELLED = {"outcome": "cancelled"}
+_EMPTY_TEXT_PART = {"type": "text", "text": ""}
+_IMAGE_ONLY_TEXT_PART = {"type": "text", "text": "?"}
+
 
 @dataclass
 class ToolCallInfo:
@@ -54,7 +73,7 @@ class ACPClient:
         self._active_prompts: dict[str, int] = {}
         self._permission_handler: PermissionHandler | None = None
         self._stream_callbacks: dict[str, StreamCallback] = {}
-        self._stream_accum: dict[str, list[str]] = {}
+        self._stream_accum: dict[str, str] = {}
         self._session_modes: dict[str, dict] = {}
         self._session_models: dict[str, dict] = {}
         self._running = False
@@ -79,13 +98,11 @@ class ACPClient:
 
         result = self._send_request("initialize", {
             "protocolVersion": 1,
-            "clientCapabilities": {
-                "fs": {"readTextFile": True, "writeTextFile": True},
-                "terminal": True,
-            },
-            "clientInfo": {"name": "kiro2chat", "version": "1.0.0"},
+            "clientCapabilities": _CLIENT_CAPABILITIES,
+            "clientInfo": _CLIENT_INFO,
         })
-        log.info("[ACP] Initialized: %s", json.dumps(result, ensure_ascii=False)[:200])
+        if log.isEnabledFor(logging.INFO):
+            log.info("[ACP] Initialized: %s", json.dumps(result, ensure_ascii=False)[:200])
         return result
 
     def stop(self):
@@ -113,10 +130,11 @@ class ACPClient:
         session_id = result.get("sessionId", "")
         if not session_id:
             raise RuntimeError(f"session/new returned no sessionId: {result}")
-        self._session_modes[session_id] = result.get("modes", {})
+        modes = result.get("modes", {})
+        self._session_modes[session_id] = modes
         self._session_models[session_id] = result.get("models", {})
         log.info("[ACP] New session: %s", session_id)
-        return session_id, result.get("modes", {})
+        return session_id, modes
 
     def session_prompt(
         self,
@@ -129,7 +147,7 @@ class ACPClient:
         self._session_updates[session_id] = []
         if on_stream:
             self._stream_callbacks[session_id] = on_stream
-            self._stream_accum[session_id] = []
+            self._stream_accum[session_id] = ""
 
         req_id = self._next_id()
         self._active_prompts[session_id] = req_id
@@ -147,9 +165,9 @@ class ACPClient:
             if text:
                 prompt_content.append({"type": "text", "text": text})
             elif images:
-                prompt_content.append({"type": "text", "text": "?"})
+                prompt_content.append(_IMAGE_ONLY_TEXT_PART)
             if not prompt_content:
-                prompt_content.append({"type": "text", "text": ""})
+                prompt_content.append(_EMPTY_TEXT_PART)
 
             result = self._send_request_with_id("session/prompt", {
                 "sessionId": session_id,
@@ -196,9 +214,10 @@ class ACPClient:
             return self._req_id
 
     def _send_raw(self, msg: dict):
-        data = json.dumps(msg, ensure_ascii=False) + "\n"
-        log.debug("[ACP] >>> %s", data.strip()[:500])
-        self._proc.stdin.write(data.encode())
+        text = json.dumps(msg, ensure_ascii=False)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[ACP] >>> %s", text[:500])
+        self._proc.stdin.write(text.encode() + b"\n")
         self._proc.stdin.flush()
 
     def _send_notification(self, method: str, params: dict):
@@ -245,7 +264,8 @@ class ACPClient:
                 line = self._proc.stderr.readline()
                 if not line:
                     break
-                log.debug("[ACP stderr] %s", line.decode(errors="replace").strip())
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("[ACP stderr] %s", line.decode(errors="replace").strip())
             except Exception:
                 break
 
@@ -258,7 +278,8 @@ class ACPClient:
             log.warning("[ACP] Non-JSON: %s", line[:200])
             return
 
-        log.debug("[ACP] <<< %s", line[:500])
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[ACP] <<< %s", line[:500])
         msg_id = msg.get("id")
         method = msg.get("method")
 
@@ -294,14 +315,21 @@ class ACPClient:
 
         if update.get("sessionUpdate") == "agent_message_chunk":
             content = update.get("content", {})
-            if isinstance(content, dict) and content.get("type") == "text":
-                chunk = content.get("text", "")
+            # EAFP: content is a dict in practice; non-dicts just yield no chunk
+            try:
+                chunk = content.get("text", "") if content.get("type") == "text" else ""
+            except AttributeError:
+                chunk = ""
+            if chunk:
                 cb = self._stream_callbacks.get(session_id)
                 accum = self._stream_accum.get(session_id)
-                if cb and accum is not None and chunk:
-                    accum.append(chunk)
+                if cb and accum is not None:
+                    # Extend the accumulated text in place — one concat per
+                    # chunk instead of re-joining every chunk seen so far.
+                    accum += chunk
+                    self._stream_accum[session_id] = accum
                     try:
-                        cb(chunk, "".join(accum))
+                        cb(chunk, accum)
                     except Exception as e:
                         log.debug("[ACP] Stream callback error: %s", e)
 
@@ -334,7 +362,7 @@ class ACPClient:
 
     def _send_permission_response(self, msg_id: int, option_id: str):
         if option_id == "deny":
-            outcome = {"outcome": "cancelled"}
+            outcome = _OUTCOME_CANCELLED
         else:
             outcome = {"outcome": "selected", "optionId": option_id}
         self._send_raw({"jsonrpc": "2.0", "id": msg_id, "result": {"outcome": outcome}})
@@ -351,8 +379,11 @@ class ACPClient:
             st = update.get("sessionUpdate", "")
             if st == "agent_message_chunk":
                 content = update.get("content", {})
-                if isinstance(content, dict) and content.get("type") == "text":
-                    text_parts.append(content.get("text", ""))
+                try:
+                    if content.get("type") == "text":
+                        text_parts.append(content.get("text", ""))
+                except AttributeError:
+                    pass
             elif st == "tool_call":
                 tc_id = update.get("toolCallId", "")
                 tool_calls[tc_id] = ToolCallInfo(
@@ -366,8 +397,9 @@ class ACPClient:
                 tc = tool_calls.get(tc_id)
                 if tc:
                     tc.status = update.get("status", tc.status)
-                    if update.get("title"):
-                        tc.title = update["title"]
+                    title = update.get("title")
+                    if title:
+                        tc.title = title
                     for c in update.get("content", []):
                         if isinstance(c, dict):
                             inner = c.get("content", {})
@@ -382,14 +414,9 @@ class ACPClient:
 
     @staticmethod
     def _detect_image_mime(b64_data: str) -> str | None:
-        if b64_data.startswith("iVBORw"):
-            return "image/png"
-        elif b64_data.startswith("/9j/"):
-            return "image/jpeg"
-        elif b64_data.startswith("R0lGOD"):
-            return "image/gif"
-        elif b64_data.startswith("UklGR"):
-            return "image/webp"
+        for prefix, mime in _B64_IMAGE_SIGNATURES:
+            if b64_data.startswith(prefix):
+                return mime
         return None
 
     def _kill_children(self, parent_pid: int):
@@ -5,12 +5,13 @@ import base64
 import logging
 import os
 import re
+import time
 import unicodedata
 from collections import defaultdict
 from typing import Optional
 
 from aiogram import Bot, Dispatcher, Router, F
-from aiogram.types import Message, BotCommand, InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery
+from aiogram.types import Message, BotCommand, FSInputFile, InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery
 from aiogram.filters import Command
 from aiogram.enums import ParseMode
 
@@ -21,6 +22,7 @@ from ..acp.client import PermissionRequest, ToolCallInfo
 logger = logging.getLogger(__name__)
 
 EDIT_INTERVAL = 15  # edit message every N chunks
+EDIT_MIN_SECONDS = 1.5  # floor between edits (Telegram throttles edits per chat)
 
 router = Router()
 
@@ -44,7 +46,11 @@ def _chat_id(message: Message) -> str:
 # ── Markdown / HTML rendering (reused from original bot) ──
 
 def _display_width(s: str) -> int:
-    return sum(2 if unicodedata.east_asian_width(c) in ('W', 'F') else 1 for c in s)
+    if s.isascii():  # no wide chars possible
+        return len(s)
+    # len(s) plus one extra column per wide char — sums bools instead of
+    # selecting 2-vs-1 per char.
+    return len(s) + sum(unicodedata.east_asian_width(c) in ('W', 'F') for c in s)
 
 
 def _pad(s: str, width: int) -> str:
@@ -62,8 +68,10 @@ def _table_to_pre(text: str) -> str:
         widths = [max(_display_width(row[c]) for row in table_lines) for c in range(len(table_lines[0]))]
         result.append("  ".join(_pad(cell, w) for cell, w in zip(table_lines[0], widths)))
         result.append("  ".join("-" * w for w in widths))
-        for row in table_lines[1:]:
-            result.append("  ".join(_pad(cell, w) for cell, w in zip(row, widths)))
+        result.extend(
+            "  ".join(_pad(cell, w) for cell, w in zip(row, widths))
+            for row in table_lines[1:]
+        )
         table_lines.clear()
 
     for line in lines:
@@ -88,22 +96,35 @@ def _escape_html(s: str) -> str:
     return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
-def _apply_inline(s: str) -> str:
-    s = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', s)
-    s = re.sub(r'__(.+?)__', r'<b>\1</b>', s)
-    s = re.sub(r'(?<!\w)\*(?!\s)(.+?)(?<!\s)\*(?!\w)', r'<i>\1</i>', s)
-    s = re.sub(r'(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)', r'<i>\1</i>', s)
-    return s
+# Combined inline pattern: code span | bold (** / __) | italic (* / _).
+# One alternation means one scan over the text instead of one pass per style.
+_INLINE_RE = re.compile(
+    r'`([^`]+)`'
+    r'|\*\*(.+?)\*\*'
+    r'|__(.+?)__'
+    r'|(?<!\w)\*(?!\s)(.+?)(?<!\s)\*(?!\w)'
+    r'|(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)'
+)
 
 
 def _escape_and_format(s: str) -> str:
+    """Escape HTML and apply inline markdown in a single pass over the text."""
+    # Fast path: text without any inline markers skips the regex scan entirely.
+    if "`" not in s and "*" not in s and "_" not in s:
+        return _escape_html(s)
     result = []
     last = 0
-    for m in re.finditer(r'`([^`]+)`', s):
-        result.append(_apply_inline(_escape_html(s[last:m.start()])))
-        result.append(f"<code>{_escape_html(m.group(1))}</code>")
+    for m in _INLINE_RE.finditer(s):
+        result.append(_escape_html(s[last:m.start()]))
+        code, bold1, bold2, ital1, ital2 = m.groups()
+        if code is not None:
+            result.append(f"<code>{_escape_html(code)}</code>")
+        elif bold1 is not None or bold2 is not None:
+            result.append(f"<b>{_escape_and_format(bold1 if bold1 is not None else bold2)}</b>")
+        else:
+            result.append(f"<i>{_escape_and_format(ital1 if ital1 is not None else ital2)}</i>")
         last = m.end()
-    result.append(_apply_inline(_escape_html(s[last:])))
+    result.append(_escape_html(s[last:]))
     return "".join(result)
 
 
@@ -119,20 +140,94 @@ def _md_to_html(text: str) -> str:
     return "".join(parts)
 
 
-def _clean_response(text: str) -> str:
-    text = re.sub(r"<function_calls>.*?</function_calls>", "", text, flags=re.DOTALL)
-    text = re.sub(r"<invoke.*?</invoke>", "", text, flags=re.DOTALL)
-    text = re.sub(r"<tool_call>.*?</tool_call>", "", text, flags=re.DOTALL)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+TG_MAX_LEN = 4096  # Telegram message limit, counted in UTF-16 code units of visible text
+
+_HTML_TOKEN_RE = re.compile(r'<(/?)(b|i|code|pre)>|&(?:amp|lt|gt);')
+
+
+def _truncate_html(html: str, limit: int = TG_MAX_LEN) -> str:
+    """Truncate rendered Telegram HTML to `limit` UTF-16 code units.
+
+    Telegram counts the parsed text (tags excluded, entities as one char) in
+    UTF-16 code units, so astral chars (emoji) count as 2. Never cuts inside
+    a tag, an entity, or a surrogate pair, and closes any tags left open.
+    """
+    # Fast accept: fits even under worst-case accounting (every char counting
+    # 2 UTF-16 units, or exactly 1 for pure ASCII), so skip the token walk.
+    if len(html) * 2 <= limit or (html.isascii() and len(html) <= limit):
+        return html
+    out: list[str] = []
+    used = 0
+    open_tags: list[str] = []
+    pos = 0
+
+    def take_text(text: str) -> bool:
+        nonlocal used
+        if text.isascii() and used + len(text) <= limit:
+            used += len(text)
+            out.append(text)
+            return True
+        for i, ch in enumerate(text):
+            w = 2 if ord(ch) > 0xFFFF else 1
+            if used + w > limit:
+                out.append(text[:i])
+                return False
+            used += w
+        out.append(text)
+        return True
+
+    for m in _HTML_TOKEN_RE.finditer(html):
+        if not take_text(html[pos:m.start()]):
+            break
+        token = m.group(0)
+        if token.startswith("&"):
+            if used + 1 > limit:
+                break
+            used += 1
+            out.append(token)
+        else:
+            closing, name = m.group(1), m.group(2)
+            if closing:
+                if open_tags and open_tags[-1] == name:
+                    open_tags.pop()
+            else:
+                open_tags.append(name)
+            out.append(token)
+        pos = m.end()
+    else:
+        if take_text(html[pos:]):
+            return "".join(out)
+    out.extend(f"</{name}>" for name in reversed(open_tags))
+    return "".join(out)
+
+
+# Leaked tool-call XML, stripped in one combined pass
+_STRIP_RE = re.compile(
+    r"<function_calls>.*?</function_calls>"
+    r"|<invoke.*?</invoke>"
+    r"|<tool_call>.*?</tool_call>",
+    re.DOTALL,
+)
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+
+def _clean_response(text: str, *, collapse_newlines: bool = True) -> str:
+    text = _STRIP_RE.sub("", text)
+    if collapse_newlines:
+        text = _MULTI_NEWLINE_RE.sub("\n\n", text)
     return text.strip()
 
 
+_TOOL_ICONS = {"file_read": "📄", "file_edit": "📝", "terminal": "⚡"}
+_TOOL_STATUS_ICONS = {"completed": "✅", "failed": "❌", "cancelled": "🚫"}
+
+
 def _tool_icon(kind: str) -> str:
-    return {"file_read": "📄", "file_edit": "📝", "terminal": "⚡"}.get(kind, "🔧")
+    return _TOOL_ICONS.get(kind, "🔧")
 
 
 def _tool_status_icon(status: str) -> str:
-    return {"completed": "✅", "failed": "❌", "cancelled": "🚫"}.get(status, "⏳")
+    return _TOOL_STATUS_ICONS.get(status, "⏳")
 
 
 # ── Commands ──
@@ -316,20 +411,32 @@ async def _handle_message(message: Message, *, has_photo=False, has_document_ima
 
         # Streaming state
         chunk_count = 0
+        last_edit = 0.0
         tool_lines: list[str] = []
         loop = asyncio.get_running_loop()
 
         def on_stream(chunk: str, accumulated: str):
-            nonlocal chunk_count
+            nonlocal chunk_count, last_edit
             chunk_count += 1
             if chunk_count % EDIT_INTERVAL == 0:
-                display = _clean_response(accumulated)
+                # Coalesce bursts: fast streams hit the chunk interval faster
+                # than Telegram accepts edits, so also enforce a time floor.
+                now = time.monotonic()
+                if now - last_edit < EDIT_MIN_SECONDS:
+                    return
+                last_edit = now
+                # The preview gets truncated to TG_MAX_LEN visible units, so
+                # clean/render only a bounded prefix instead of re-scanning the
+                # whole turn on every edit. (2x covers markup stripped by
+                # cleaning; the final render below still uses the full text.)
+                # Newline collapsing is cosmetic; leave it to the final render.
+                display = _clean_response(accumulated[:TG_MAX_LEN * 2], collapse_newlines=False)
                 if display:
                     preview = display
                     if tool_lines:
                         preview = "\n".join(tool_lines) + "\n\n" + display
                     asyncio.run_coroutine_threadsafe(
-                        _safe_edit(reply, _md_to_html(preview)[:4096]),
+                        _safe_edit(reply, _truncate_html(_md_to_html(preview))),
                         loop,
                     )
 
@@ -342,10 +449,10 @@ async def _handle_message(message: Message, *, has_photo=False, has_document_ima
             # Build final display
             parts = []
             if result.tool_calls:
-                for tc in result.tool_calls:
-                    icon = _tool_icon(tc.kind)
-                    status = _tool_status_icon(tc.status)
-                    parts.append(f"{icon} {tc.title} {status}")
+                parts = [
+                    f"{_tool_icon(tc.kind)} {tc.title} {_tool_status_icon(tc.status)}"
+                    for tc in result.tool_calls
+                ]
                 parts.append("")
             clean = _clean_response(result.text)
             if clean:
@@ -353,7 +460,7 @@ async def _handle_message(message: Message, *, has_photo=False, has_document_ima
 
             display = "\n".join(parts) or "(empty response)"
             try:
-                await reply.edit_text(_md_to_html(display)[:4096], parse_mode=ParseMode.HTML)
+                await reply.edit_text(_truncate_html(_md_to_html(display)), parse_mode=ParseMode.HTML)
             except Exception:
                 try:
                     await reply.edit_text(display[:4096])
@@ -480,7 +587,6 @@ class TelegramAdapter(BaseAdapter):
 
     async def send_image(self, chat_id: str, path: str):
         if _bot and os.path.isfile(path):
-            from aiogram.types import FSInputFile
             tg_id = int(chat_id.split(":")[0])
             await _bot.send_photo(tg_id, FSInputFile(path))
 
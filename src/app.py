@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import subprocess
 import sys
 
 from . import __version__
@@ -92,12 +93,10 @@ _TMUX_SESSIONS = {
 
 
 def _tmux_running(session: str) -> bool:
-    import subprocess
     return subprocess.run(["tmux", "has-session", "-t", session], capture_output=True).returncode == 0
 
 
 def _tmux_start(session: str, cmd: str):
-    import subprocess
     from pathlib import Path
     cwd = str(Path(__file__).parent.parent)
     subprocess.run(["tmux", "new-session", "-d", "-s", session, "-c", cwd, cmd], check=True)
@@ -105,7 +104,6 @@ def _tmux_start(session: str, cmd: str):
 
 
 def _tmux_stop(session: str):
-    import subprocess
     subprocess.run(["tmux", "kill-session", "-t", session], check=True)
     print(f"Stopped (tmux session: {session})")
 
@@ -136,7 +134,6 @@ def _handle_bg(service: str, action: str):
         if not _tmux_running(session):
             print(f"{session}: stopped")
         else:
-            import subprocess
             pid = subprocess.run(
                 ["tmux", "list-panes", "-t", session, "-F", "#{pane_pid}"],
                 capture_output=True, text=True,
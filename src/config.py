@@ -2,10 +2,15 @@
 
 import os
 from pathlib import Path
-from dataclasses import dataclass
-from dotenv import load_dotenv
 
-load_dotenv()
+# .env is for dev/manual runs; systemd deployments already inject it via
+# EnvironmentFile, so KIRO2CHAT_ENV=production skips the filesystem scan.
+if os.getenv("KIRO2CHAT_ENV") != "production":
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
 
 
 def _load_toml_defaults() -> dict:
@@ -16,40 +21,64 @@ def _load_toml_defaults() -> dict:
         return {}
 
 
-_file_cfg = _load_toml_defaults()
+_file_cfg: dict | None = None
 
 
 def _get(key: str, env_key: str | None = None) -> str | None:
+    global _file_cfg
     env = env_key or key.upper()
     val = os.getenv(env)
     if val is not None:
         return val
+    if _file_cfg is None:
+        _file_cfg = _load_toml_defaults()
     val = _file_cfg.get(key)
     if val is not None:
         return str(val)
     return None
 
 
-@dataclass
-class Config:
-    log_level: str = _get("log_level", "LOG_LEVEL") or "info"
+# Field factories, evaluated on first attribute access (env > TOML > default).
+_FIELDS = {
+    "log_level": lambda: _get("log_level", "LOG_LEVEL") or "info",
 
     # Data directory (logs, workspaces, etc.)
-    data_dir: Path = Path(
+    "data_dir": lambda: Path(
         _get("data_dir", "KIRO2CHAT_DATA_DIR")
         or str(Path.home() / ".local/share/kiro2chat")
-    ).expanduser()
+    ).expanduser(),
 
     # Telegram bot
-    tg_bot_token: str | None = _get("tg_bot_token", "TG_BOT_TOKEN")
+    "tg_bot_token": lambda: _get("tg_bot_token", "TG_BOT_TOKEN"),
 
     # ACP settings
-    kiro_cli_path: str = _get("kiro_cli_path", "KIRO_CLI_PATH") or "kiro-cli"
-    workspace_mode: str = _get("workspace_mode", "WORKSPACE_MODE") or "per_chat"
-    working_dir: str = _get("working_dir", "WORKING_DIR") or str(
+    "kiro_cli_path": lambda: _get("kiro_cli_path", "KIRO_CLI_PATH") or "kiro-cli",
+    "workspace_mode": lambda: _get("workspace_mode", "WORKSPACE_MODE") or "per_chat",
+    "working_dir": lambda: _get("working_dir", "WORKING_DIR") or str(
         Path.home() / ".local/share/kiro2chat/workspaces"
-    )
-    idle_timeout: int = int(_get("idle_timeout", "IDLE_TIMEOUT") or "300")
+    ),
+    "idle_timeout": lambda: int(_get("idle_timeout", "IDLE_TIMEOUT") or "300"),
+}
+
+
+class Config:
+    """Lazily-resolved config: each value is computed on first access, then cached."""
+
+    log_level: str
+    data_dir: Path
+    tg_bot_token: str | None
+    kiro_cli_path: str
+    workspace_mode: str
+    working_dir: str
+    idle_timeout: int
+
+    def __getattr__(self, name: str):
+        factory = _FIELDS.get(name)
+        if factory is None:
+            raise AttributeError(name)
+        value = factory()
+        setattr(self, name, value)
+        return value
 
 
 config = Config()
@@ -1,6 +1,7 @@
 """Config file management for kiro2chat."""
 
 from pathlib import Path
+from types import MappingProxyType
 
 CONFIG_DIR = Path.home() / ".config" / "kiro2chat"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
@@ -15,10 +16,22 @@ _SECTIONS = {
 }
 
 
+# Parsed-file caches, invalidated when the file's mtime changes
+# (covers both save_* here and out-of-band edits).
+_config_cache: tuple[int, dict] | None = None  # (mtime_ns, flat dict)
+_mcp_cache: tuple[int, dict] | None = None
+
+
 def load_config_file() -> dict:
     """Read config from TOML file, return flat dict."""
-    if not CONFIG_FILE.exists():
+    global _config_cache
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        _config_cache = None
         return {}
+    if _config_cache is not None and _config_cache[0] == mtime:
+        return _config_cache[1]
 
     import tomllib
 
@@ -33,14 +46,20 @@ def load_config_file() -> dict:
                 flat[k] = v
         else:
             flat[section_key] = section_data
-    return flat
+    # Freeze: the cached mapping is shared across callers, so hand out a
+    # read-only view instead of the mutable dict.
+    frozen = MappingProxyType(flat)
+    _config_cache = (mtime, frozen)
+    return frozen
 
 
 def save_config_file(flat: dict) -> None:
     """Write flat config dict to TOML file with sections."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Group by section
+    import tomli_w
+
+    # Group by section (nested dicts become sub-tables, e.g. model.model_map)
     sections: dict[str, dict] = {}
     for key, value in flat.items():
         if value is None or value == "":
@@ -48,41 +67,26 @@ def save_config_file(flat: dict) -> None:
         section = _SECTIONS.get(key, "general")
         sections.setdefault(section, {})[key] = value
 
-    # Write TOML manually (avoid extra dep at import time)
-    lines: list[str] = []
-    for section, kvs in sections.items():
-        lines.append(f"[{section}]")
-        for k, v in kvs.items():
-            if isinstance(v, dict):
-                # Write dict as separate sub-table
-                lines.append("")
-                lines.append(f"[{section}.{k}]")
-                for dk, dv in v.items():
-                    lines.append(f'"{dk}" = "{dv}"')
-                continue
-            elif isinstance(v, list):
-                items = ", ".join(f'"{i}"' for i in v)
-                lines.append(f"{k} = [{items}]")
-            elif isinstance(v, int):
-                lines.append(f"{k} = {v}")
-            elif isinstance(v, bool):
-                lines.append(f"{k} = {'true' if v else 'false'}")
-            else:
-                lines.append(f'{k} = "{v}"')
-        lines.append("")
-
-    CONFIG_FILE.write_text("\n".join(lines), encoding="utf-8")
+    CONFIG_FILE.write_text(tomli_w.dumps(sections), encoding="utf-8")
 
 
 def load_mcp_config() -> dict:
     """Load MCP server configuration from Kiro CLI's config (~/.kiro/settings/mcp.json)."""
+    global _mcp_cache
     import json
-    if not KIRO_MCP_CONFIG.exists():
+    try:
+        mtime = KIRO_MCP_CONFIG.stat().st_mtime_ns
+    except OSError:
+        _mcp_cache = None
         return {"mcpServers": {}}
+    if _mcp_cache is not None and _mcp_cache[0] == mtime:
+        return _mcp_cache[1]
     try:
-        return json.loads(KIRO_MCP_CONFIG.read_text())
+        data = json.loads(KIRO_MCP_CONFIG.read_text())
     except Exception:
         return {"mcpServers": {}}
+    _mcp_cache = (mtime, data)
+    return data
 
 
 def save_mcp_config(config: dict) -> None:
@@ -119,11 +119,11 @@ def test_stream_callback():
     client._session_updates[sid] = []
     chunks = []
     client._stream_callbacks[sid] = lambda c, a: chunks.append(c)
-    client._stream_accum[sid] = []
+    client._stream_accum[sid] = ""
 
     client._handle_session_update(sid, {
         "sessionUpdate": "agent_message_chunk",
         "content": {"type": "text", "text": "hi"},
     })
     assert chunks == ["hi"]
-    assert client._stream_accum[sid] == ["hi"]
+    assert client._stream_accum[sid] == "hi"